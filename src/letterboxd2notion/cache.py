@@ -0,0 +1,87 @@
+"""On-disk cache for TMDB lookups."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "letterboxd2notion" / "tmdb.sqlite"
+
+# Cached movies older than this are treated as missing
+MOVIE_TTL = 30 * 24 * 60 * 60
+# Cached movies older than this are still served, but refreshed in the background
+MOVIE_STALE_AFTER = 24 * 60 * 60
+# Stored for slugs whose film page has no TMDB movie (e.g. TV), so they aren't refetched
+NO_TMDB_ID = 0
+
+
+class TMDBCache:
+    """SQLite-backed cache of TMDB movie details and Letterboxd slug -> TMDB ID mappings."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        # Movies served past MOVIE_STALE_AFTER this run, awaiting a refresh
+        self.stale_ids: set[int] = set()
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS movies ("
+                "tmdb_id INTEGER PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            # A film's TMDB ID never changes, so slug mappings don't expire
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS slugs (slug TEXT PRIMARY KEY, tmdb_id INTEGER NOT NULL)"
+            )
+
+    def __enter__(self) -> "TMDBCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def get_movie(self, tmdb_id: int) -> tuple[dict[str, Any], float] | None:
+        """Get cached movie details.
+
+        Returns:
+            Tuple of (movie_data, age_in_seconds), or None if missing or expired
+        """
+        row = self._conn.execute(
+            "SELECT data, fetched_at FROM movies WHERE tmdb_id = ?", (tmdb_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        age = time.time() - row[1]
+        if age > MOVIE_TTL:
+            return None
+
+        return json.loads(row[0]), age
+
+    def set_movie(self, tmdb_id: int, data: dict[str, Any]) -> None:
+        """Store movie details, replacing any existing entry."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO movies (tmdb_id, data, fetched_at) VALUES (?, ?, ?)",
+                (tmdb_id, json.dumps(data), time.time()),
+            )
+
+    def get_tmdb_id(self, slug: str) -> int | None:
+        """Get the cached TMDB ID for a Letterboxd film slug.
+
+        Returns:
+            The TMDB ID, NO_TMDB_ID if the film is known to have none, or None if not cached
+        """
+        row = self._conn.execute("SELECT tmdb_id FROM slugs WHERE slug = ?", (slug,)).fetchone()
+        return row[0] if row else None
+
+    def set_tmdb_id(self, slug: str, tmdb_id: int) -> None:
+        """Store the TMDB ID for a Letterboxd film slug."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO slugs (slug, tmdb_id) VALUES (?, ?)", (slug, tmdb_id)
+            )
@@ -5,6 +5,11 @@ from typing import Any
 
 import click
 
+try:
+    from uvloop import run as run_async
+except ImportError:  # uvloop doesn't support Windows
+    from asyncio import run as run_async
+
 from letterboxd2notion import __version__
 from letterboxd2notion.config import Settings, get_settings
 
@@ -27,19 +32,27 @@ def main(ctx: click.Context) -> None:
 @click.option("--full", is_flag=True, help="Full sync using HTML scraping")
 @click.option("--dry-run", is_flag=True, help="Show what would be synced without syncing")
 @click.option("--limit", type=int, help="Limit number of films to sync")
+@click.option("--new-only", is_flag=True, help="Skip entries already in the Notion database")
 @click.pass_context
-def sync(ctx: click.Context, full: bool, dry_run: bool, limit: int | None) -> None:
+def sync(
+    ctx: click.Context,
+    full: bool,
+    dry_run: bool,
+    limit: int | None,
+    new_only: bool,
+) -> None:
     """Sync films from Letterboxd to Notion.
 
     By default, uses RSS feed for incremental sync (~50 most recent).
     Use --full for complete history sync via HTML scraping.
+    Use --new-only to skip entries already synced instead of updating them.
     """
     settings: Settings | None = ctx.obj.get("settings")
     if settings is None:
         click.echo(f"Error loading settings: {ctx.obj.get('settings_error')}", err=True)
         ctx.exit(1)
 
-    asyncio.run(_sync(settings, full=full, dry_run=dry_run, limit=limit))
+    run_async(_sync(settings, full=full, dry_run=dry_run, limit=limit, new_only=new_only))
 
 
 async def _sync(
@@ -47,30 +60,64 @@ async def _sync(
     full: bool,
     dry_run: bool,
     limit: int | None,
+    new_only: bool,
 ) -> None:
     """Async sync implementation."""
     import httpx
 
+    from letterboxd2notion.cache import TMDBCache
     from letterboxd2notion.notion.client import NotionClient
     from letterboxd2notion.notion.sync import NotionSync
-    from letterboxd2notion.parsers import enrich_film_with_tmdb
+    from letterboxd2notion.parsers import (
+        RequestThrottle,
+        enrich_films,
+        refresh_stale_movies,
+    )
     from letterboxd2notion.parsers.html_parser import parse_all_diary_pages
     from letterboxd2notion.parsers.rss_parser import parse_rss_feed
 
     click.echo(f"Syncing for user: {settings.letterboxd_username}")
 
-    async with httpx.AsyncClient() as http_client:
+    # Letterboxd is scraped over HTTP/1.1 with a small pool; TMDB gets its own
+    # HTTP/2 client so concurrent lookups multiplex over a few connections
+    letterboxd_limits = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+    tmdb_limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    async with (
+        # Film page lookups can queue behind the pool during enrichment
+        httpx.AsyncClient(
+            limits=letterboxd_limits,
+            timeout=httpx.Timeout(10.0, pool=None),
+        ) as http_client,
+        httpx.AsyncClient(
+            http2=True,
+            limits=tmdb_limits,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            event_hooks={"request": [RequestThrottle(settings.tmdb_rate_limit_delay)]},
+        ) as tmdb_client,
+        NotionClient(settings.notion_token, rate_limit_delay=settings.rate_limit_delay) as notion,
+    ):
+        sync_client = NotionSync(notion, settings.notion_database_id)
+        skip_ids = None
+        if new_only:
+            # Load existing entries up front so the parsers can skip them
+            await sync_client.initialize()
+            click.echo(f"Found {sync_client.existing_count} existing entries in database")
+            skip_ids = sync_client.existing_ids
+
         # Parse films
         if full:
             click.echo("Performing full sync via HTML scraping...")
             films = await parse_all_diary_pages(
                 http_client,
                 settings.letterboxd_diary_url,
-                on_page=lambda p: click.echo(f"  Fetching page {p}..."),
+                on_page=lambda p: click.echo(f"  Fetched page {p}"),
+                skip_ids=skip_ids,
             )
         else:
             click.echo("Performing incremental sync via RSS feed...")
             films = await parse_rss_feed(http_client, settings.letterboxd_rss_url)
+            if skip_ids is not None:
+                films = [film for film in films if film.letterboxd_id not in skip_ids]
 
         click.echo(f"Found {len(films)} films")
 
@@ -80,39 +127,68 @@ async def _sync(
 
         # Enrich with TMDB data
         click.echo("Enriching with TMDB data...")
-        enriched_films = []
-        with click.progressbar(films, label="Fetching backdrops") as bar:
-            for film in bar:
-                try:
-                    enriched = await enrich_film_with_tmdb(http_client, film, settings.tmdb_api_key)
-                    enriched_films.append(enriched)
-                except Exception as e:
-                    click.echo(f"\n  Warning: TMDB error for {film.title}: {e}", err=True)
-                    enriched_films.append(film)
-                await asyncio.sleep(0.25)  # TMDB rate limit
-
-        if dry_run:
-            click.echo("\nDry run - would sync:")
-            for film in enriched_films:
-                status = "new"
-                stars = f" - {film.rating_stars}" if film.rating else ""
-                click.echo(f"  [{status}] {film.title} ({film.year}){stars}")
-            return
-
-        # Sync to Notion
-        click.echo("\nSyncing to Notion...")
-        async with NotionClient(settings.notion_token) as notion:
-            sync_client = NotionSync(notion, settings.notion_database_id)
-            await sync_client.initialize()
-            click.echo(f"Found {sync_client.existing_count} existing entries in database")
+        with TMDBCache() as tmdb_cache:
+            with click.progressbar(length=len(films), label="Fetching backdrops") as bar:
+
+                def on_enriched(film: Any, error: Exception | None) -> None:
+                    if error:
+                        click.echo(f"\n  Warning: TMDB error for {film.title}: {error}", err=True)
+                    bar.update(1)
+
+                enriched_films = await enrich_films(
+                    tmdb_client,
+                    films,
+                    settings.tmdb_api_key,
+                    on_enriched=on_enriched,
+                    cache=tmdb_cache,
+                    letterboxd_client=http_client,
+                )
+
+            # Refresh stale cache entries while the Notion sync runs
+            refresh = asyncio.create_task(
+                refresh_stale_movies(tmdb_client, settings.tmdb_api_key, tmdb_cache)
+            )
+            try:
+                await _sync_to_notion(sync_client, enriched_films, dry_run, new_only)
+            finally:
+                failures = await refresh
+                if failures:
+                    tmdb_id, error = failures[0]
+                    click.echo(
+                        f"Warning: failed to refresh {len(failures)} cached TMDB entries "
+                        f"(e.g. {tmdb_id}: {error})",
+                        err=True,
+                    )
+
+
+async def _sync_to_notion(
+    sync_client: Any,
+    films: list[Any],
+    dry_run: bool,
+    new_only: bool,
+) -> None:
+    """Sync enriched films to Notion, or list them on a dry run."""
+    if dry_run:
+        click.echo("\nDry run - would sync:")
+        for film in films:
+            status = "new"
+            stars = f" - {film.rating_stars}" if film.rating else ""
+            click.echo(f"  [{status}] {film.title} ({film.year}){stars}")
+        return
+
+    # Sync to Notion
+    click.echo("\nSyncing to Notion...")
+    if not new_only:
+        await sync_client.initialize()
+        click.echo(f"Found {sync_client.existing_count} existing entries in database")
 
-            def on_progress(film: Any, action: str) -> None:
-                symbol = "+" if action == "created" else "~"
-                click.echo(f"  [{symbol}] {film.title}")
+    def on_progress(film: Any, action: str) -> None:
+        symbol = "+" if action == "created" else "~"
+        click.echo(f"  [{symbol}] {film.title}")
 
-            counts = await sync_client.sync_films(enriched_films, on_progress=on_progress)
+    counts = await sync_client.sync_films(films, on_progress=on_progress)
 
-            click.echo(f"\nSync complete: {counts['created']} created, {counts['updated']} updated")
+    click.echo(f"\nSync complete: {counts['created']} created, {counts['updated']} updated")
 
 
 @main.command("init-schema")
@@ -124,7 +200,7 @@ def init_schema(ctx: click.Context) -> None:
         click.echo(f"Error loading settings: {ctx.obj.get('settings_error')}", err=True)
         ctx.exit(1)
 
-    asyncio.run(_init_schema(settings))
+    run_async(_init_schema(settings))
 
 
 async def _init_schema(settings: Settings) -> None:
@@ -161,7 +237,7 @@ def check_schema(ctx: click.Context) -> None:
         click.echo(f"Error loading settings: {ctx.obj.get('settings_error')}", err=True)
         ctx.exit(1)
 
-    asyncio.run(_check_schema(settings))
+    run_async(_check_schema(settings))
 
 
 async def _check_schema(settings: Settings) -> None:
@@ -206,7 +282,7 @@ def test_rss(ctx: click.Context, limit: int) -> None:
     # Allow running without full settings - just need username
     username = settings.letterboxd_username if settings else "michaelfromyeg"
 
-    asyncio.run(_test_rss(username, limit))
+    run_async(_test_rss(username, limit))
 
 
 async def _test_rss(username: str, limit: int) -> None:
@@ -1,10 +1,18 @@
 """Application configuration using pydantic-settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Letterboxd serves bot-like clients differently, so scrape as a desktop browser
+LETTERBOXD_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment."""
@@ -24,27 +32,39 @@ class Settings(BaseSettings):
 
     # Letterboxd configuration
     letterboxd_username: str = Field(default="michaelfromyeg", alias="LETTERBOXD_USERNAME")
+    letterboxd_rss_url_override: str | None = Field(default=None, alias="LETTERBOXD_RSS_URL")
+    letterboxd_diary_url_override: str | None = Field(default=None, alias="LETTERBOXD_DIARY_URL")
+    letterboxd_films_url_override: str | None = Field(default=None, alias="LETTERBOXD_FILMS_URL")
 
     # Sync configuration
     rate_limit_delay: float = Field(default=0.35, description="Seconds between API calls")
+    tmdb_rate_limit_delay: float = Field(
+        default=0.025, description="Seconds between TMDB requests (TMDB allows ~50/s)"
+    )
 
-    @property
+    @cached_property
     def letterboxd_rss_url(self) -> str:
         """Get the Letterboxd RSS URL."""
-        import os
-        return os.getenv("LETTERBOXD_RSS_URL") or f"https://letterboxd.com/{self.letterboxd_username}/rss/"
+        return (
+            self.letterboxd_rss_url_override
+            or f"https://letterboxd.com/{self.letterboxd_username}/rss/"
+        )
 
-    @property
+    @cached_property
     def letterboxd_diary_url(self) -> str:
         """Get the Letterboxd diary URL."""
-        import os
-        return os.getenv("LETTERBOXD_DIARY_URL") or f"https://letterboxd.com/{self.letterboxd_username}/diary/"
+        return (
+            self.letterboxd_diary_url_override
+            or f"https://letterboxd.com/{self.letterboxd_username}/diary/"
+        )
 
-    @property
+    @cached_property
     def letterboxd_films_url(self) -> str:
         """Get the Letterboxd films URL."""
-        import os
-        return os.getenv("LETTERBOXD_FILMS_URL") or f"https://letterboxd.com/{self.letterboxd_username}/films/"
+        return (
+            self.letterboxd_films_url_override
+            or f"https://letterboxd.com/{self.letterboxd_username}/films/"
+        )
 
 
 @lru_cache
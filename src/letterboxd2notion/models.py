@@ -7,7 +7,11 @@ from pydantic import BaseModel, Field, computed_field
 
 
 class Film(BaseModel):
-    """Represents a film entry from Letterboxd."""
+    """Represents a film entry from Letterboxd.
+
+    Parsers coerce every field themselves and build instances with
+    model_construct, skipping validation.
+    """
 
     # Core identifiers
     letterboxd_id: str = Field(description="From guid: letterboxd-review-XXX")
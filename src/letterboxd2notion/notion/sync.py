@@ -1,6 +1,6 @@
 """Sync logic with upsert and deduplication."""
 
-from collections.abc import Callable
+from collections.abc import Callable, KeysView
 
 from letterboxd2notion.models import Film
 from letterboxd2notion.notion.client import NotionClient
@@ -122,3 +122,8 @@ class NotionSync:
     def existing_count(self) -> int:
         """Number of existing pages loaded."""
         return len(self._id_to_page)
+
+    @property
+    def existing_ids(self) -> KeysView[str]:
+        """Letterboxd IDs of existing pages loaded."""
+        return self._id_to_page.keys()
@@ -1,26 +1,84 @@
 """Parsers for Letterboxd data and TMDB enrichment."""
 
+import asyncio
+import time
+from collections.abc import Callable
+
 import httpx
+import orjson
 
+from letterboxd2notion.cache import MOVIE_STALE_AFTER, NO_TMDB_ID, TMDBCache
 from letterboxd2notion.exceptions import TMDBError
 from letterboxd2notion.models import Film
+from letterboxd2notion.parsers.html_parser import (
+    MAX_CONCURRENT_PAGES,
+    fetch_film_tmdb_id,
+    film_slug,
+)
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p"
+# Concurrent in-flight TMDB requests. This bounds parallelism, not request
+# rate; pace requests with RequestThrottle on the client.
+TMDB_CONCURRENCY = 20
+
+# Concurrent refreshes of stale cache entries, kept low so they don't crowd out
+# enrichment or Notion traffic
+REFRESH_CONCURRENCY = 4
+
+
+class RequestThrottle:
+    """httpx request hook that spaces request start times by a minimum interval.
+
+    Usage: httpx.AsyncClient(event_hooks={"request": [RequestThrottle(0.025)]})
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_request_time: float = 0
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, request: httpx.Request) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._next_request_time:
+                await asyncio.sleep(self._next_request_time - now)
+                now = self._next_request_time
+            self._next_request_time = now + self.min_interval
 
 
 async def enrich_film_with_tmdb(
     client: httpx.AsyncClient,
     film: Film,
     api_key: str,
+    cache: TMDBCache | None = None,
+    letterboxd_client: httpx.AsyncClient | None = None,
 ) -> Film:
     """Enrich a Film with TMDB backdrop/poster URLs.
 
-    If tmdb_id is available (from RSS), fetches directly by ID.
-    Otherwise, searches by title and year.
+    If tmdb_id is available (from RSS), fetches directly by ID, going through
+    the cache when one is given. Otherwise, if a Letterboxd client is given,
+    the TMDB ID is read from the film's Letterboxd page. Title and year
+    search is the last resort.
     """
-    if film.tmdb_id:
-        movie_data = await _fetch_movie_by_id(client, film.tmdb_id, api_key)
+    tmdb_id = film.tmdb_id
+    if tmdb_id is None and letterboxd_client is not None:
+        tmdb_id = await _lookup_tmdb_id(letterboxd_client, film, cache)
+    return await _enrich_film(client, film, tmdb_id, api_key, cache)
+
+
+async def _enrich_film(
+    client: httpx.AsyncClient,
+    film: Film,
+    tmdb_id: int | None,
+    api_key: str,
+    cache: TMDBCache | None,
+) -> Film:
+    """Enrich a Film from TMDB, by ID when known and by title search otherwise."""
+    if tmdb_id and cache is not None:
+        movie_data = await _fetch_movie_cached(client, tmdb_id, api_key, cache)
+    elif tmdb_id:
+        movie_data = await _fetch_movie_by_id(client, tmdb_id, api_key)
     else:
         movie_data = await _search_movie(client, film.title, film.year, api_key)
 
@@ -29,16 +87,163 @@ async def enrich_film_with_tmdb(
 
     backdrop_path = movie_data.get("backdrop_path")
     poster_path = movie_data.get("poster_path")
+    poster_url = f"{TMDB_IMAGE_BASE}/w500{poster_path}" if poster_path else None
+    # Films without a backdrop fall back to the poster
+    backdrop_url = f"{TMDB_IMAGE_BASE}/w780{backdrop_path}" if backdrop_path else poster_url
 
-    return film.model_copy(
-        update={
-            "backdrop_url": f"{TMDB_IMAGE_BASE}/w500{poster_path}" if poster_path else None,
-            "poster_url": f"{TMDB_IMAGE_BASE}/w500{poster_path}" if poster_path else None,
+    # The film is already valid and only URLs/IDs change, so build it in one
+    # pass without revalidating
+    return Film.model_construct(
+        **{
+            **film.__dict__,
+            "backdrop_url": backdrop_url,
+            "poster_url": poster_url,
             "tmdb_id": movie_data.get("id") if film.tmdb_id is None else film.tmdb_id,
         }
     )
 
 
+async def enrich_films(
+    client: httpx.AsyncClient,
+    films: list[Film],
+    api_key: str,
+    concurrency: int = TMDB_CONCURRENCY,
+    on_enriched: Callable[[Film, Exception | None], None] | None = None,
+    cache: TMDBCache | None = None,
+    letterboxd_client: httpx.AsyncClient | None = None,
+) -> list[Film]:
+    """Enrich many films with TMDB data concurrently.
+
+    Args:
+        client: Async HTTP client
+        films: Films to enrich
+        api_key: TMDB API key
+        concurrency: Maximum number of in-flight TMDB requests
+        on_enriched: Optional callback called with (film, error) as each film finishes
+        cache: Optional TMDB cache for lookups by ID and Letterboxd slug
+        letterboxd_client: Optional client for reading TMDB IDs from Letterboxd film pages
+
+    Returns:
+        Enriched films in the same order as the input. Films whose lookup
+        failed are returned unchanged.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    letterboxd_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def enrich_one(film: Film) -> Film:
+        error: Exception | None = None
+        try:
+            tmdb_id = film.tmdb_id
+            # Resolved before taking a TMDB slot, so Letterboxd backoff doesn't hold one
+            if tmdb_id is None and letterboxd_client is not None:
+                tmdb_id = await _lookup_tmdb_id(
+                    letterboxd_client, film, cache, letterboxd_semaphore
+                )
+            async with semaphore:
+                film = await _enrich_film(client, film, tmdb_id, api_key, cache)
+        except Exception as e:
+            # One bad film (HTTP, JSON or cache error) shouldn't abort the batch
+            error = e
+        if on_enriched:
+            on_enriched(film, error)
+        return film
+
+    return await asyncio.gather(*(enrich_one(film) for film in films))
+
+
+async def refresh_stale_movies(
+    client: httpx.AsyncClient,
+    api_key: str,
+    cache: TMDBCache,
+    concurrency: int = REFRESH_CONCURRENCY,
+) -> list[tuple[int, Exception]]:
+    """Re-fetch movies that enrichment served stale from the cache.
+
+    Meant to run in the background (e.g. while syncing to Notion) after
+    enrich_films has finished.
+
+    Args:
+        client: Async HTTP client
+        api_key: TMDB API key
+        cache: TMDB cache whose stale_ids should be refreshed
+        concurrency: Maximum number of refreshes in flight
+
+    Returns:
+        (tmdb_id, error) for each refresh that failed; those keep their stale copy
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    stale_ids, cache.stale_ids = cache.stale_ids, set()
+    failures: list[tuple[int, Exception]] = []
+
+    async def refresh_one(tmdb_id: int) -> None:
+        async with semaphore:
+            try:
+                movie_data = await _fetch_movie_by_id(client, tmdb_id, api_key)
+            except Exception as e:
+                failures.append((tmdb_id, e))
+                return
+        if movie_data is not None:
+            cache.set_movie(tmdb_id, movie_data)
+
+    await asyncio.gather(*(refresh_one(tmdb_id) for tmdb_id in sorted(stale_ids)))
+    return failures
+
+
+async def _lookup_tmdb_id(
+    client: httpx.AsyncClient,
+    film: Film,
+    cache: TMDBCache | None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> int | None:
+    """Resolve a film's TMDB ID from its Letterboxd page, caching by slug.
+
+    Films without a TMDB movie are cached as NO_TMDB_ID. Returns None on
+    Letterboxd HTTP errors so the caller falls back to search; RateLimitError
+    propagates once retries are exhausted so enrich_films reports it.
+    """
+    slug = film_slug(film.letterboxd_url)
+    if slug is None:
+        return None
+
+    if cache is not None:
+        tmdb_id = cache.get_tmdb_id(slug)
+        if tmdb_id is not None:
+            return None if tmdb_id == NO_TMDB_ID else tmdb_id
+
+    try:
+        tmdb_id = await fetch_film_tmdb_id(client, slug, semaphore)
+    except httpx.HTTPError:
+        return None
+
+    if cache is not None:
+        cache.set_tmdb_id(slug, NO_TMDB_ID if tmdb_id is None else tmdb_id)
+    return tmdb_id
+
+
+async def _fetch_movie_cached(
+    client: httpx.AsyncClient,
+    tmdb_id: int,
+    api_key: str,
+    cache: TMDBCache,
+) -> dict | None:
+    """Fetch movie details by TMDB ID, serving cached data when available.
+
+    Stale entries are returned immediately and recorded in cache.stale_ids
+    for refresh_stale_movies.
+    """
+    cached = cache.get_movie(tmdb_id)
+    if cached is None:
+        movie_data = await _fetch_movie_by_id(client, tmdb_id, api_key)
+        if movie_data is not None:
+            cache.set_movie(tmdb_id, movie_data)
+        return movie_data
+
+    movie_data, age = cached
+    if age > MOVIE_STALE_AFTER:
+        cache.stale_ids.add(tmdb_id)
+    return movie_data
+
+
 async def _fetch_movie_by_id(
     client: httpx.AsyncClient,
     tmdb_id: int,
@@ -53,7 +258,7 @@ async def _fetch_movie_by_id(
     if response.status_code != 200:
         raise TMDBError(f"TMDB API error: {response.status_code}")
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 async def _search_movie(
@@ -73,7 +278,7 @@ async def _search_movie(
     if response.status_code != 200:
         raise TMDBError(f"TMDB search error: {response.status_code}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     results = data.get("results", [])
 
     return results[0] if results else None
@@ -2,20 +2,71 @@
 
 import asyncio
 import re
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Container
+from contextlib import nullcontext
 from datetime import date
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from lxml import etree, html
 
-from letterboxd2notion.exceptions import RateLimitError
+from letterboxd2notion.config import LETTERBOXD_HEADERS
+from letterboxd2notion.exceptions import ParseError, RateLimitError
 from letterboxd2notion.models import Film
 
+# Concurrent diary page fetches; Letterboxd starts returning 429s well above this
+MAX_CONCURRENT_PAGES = 8
+MAX_RETRIES = 5
+# Upper bound on a single backoff sleep, whatever Retry-After asks for
+MAX_RETRY_WAIT = 60.0
+
+_FILM_URL_PREFIX = "https://letterboxd.com/film/"
+
+# "Home Alone (1990)" -> year suffix
+_YEAR_RE = re.compile(r"\((\d{4})\)$")
+_YEAR_STRIP_RE = re.compile(r"\s*\(\d{4}\)$")
+# /michaelfromyeg/diary/films/for/2025/12/26/ -> date parts
+_DATE_RE = re.compile(r"/for/(\d{4})/(\d{1,2})/(\d{1,2})")
+# "rating rated-7" -> half-star count
+_RATED_RE = re.compile(r"\brated-(\d+)\b")
+# Film slug from diary URLs (/film/heat/) and review URLs (/user/film/heat/1/)
+_SLUG_RE = re.compile(r"/film/([^/]+)/")
+# Film pages carry the TMDB reference on <body>
+_TMDB_ID_RE = re.compile(rb'data-tmdb-id="(\d+)"')
+_TMDB_TYPE_RE = re.compile(rb'data-tmdb-type="(\w+)"')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled XPath selectors, evaluated by libxml2
+_ITEMS_XP = etree.XPath(
+    f"//tr[{_has_class('diary-entry-row')}] | //li[{_has_class('poster-container')}]"
+)
+_DIARY_POSTER_XP = etree.XPath(
+    f"descendant::div[{_has_class('react-component')}][@data-item-slug][1]"
+)
+_WATCHLIST_POSTER_XP = etree.XPath(f"descendant::div[{_has_class('film-poster')}][1]")
+_IMG_XP = etree.XPath("descendant::img[1]")
+_RATING_XP = etree.XPath(f"descendant::span[{_has_class('rating')}][1]")
+_REWATCH_XP = etree.XPath(f"descendant::td[{_has_class('col-rewatch')}][1]")
+_DAYDATE_XP = etree.XPath(f"descendant::a[{_has_class('daydate')}][1]")
+# "Older" pagination link, absent on the last page
+_NEXT_PAGE_XP = etree.XPath(f"//div[{_has_class('paginate-nextprev')}]//a[{_has_class('next')}]")
+
+
+def _first(xpath: etree.XPath, element: html.HtmlElement) -> html.HtmlElement | None:
+    """Return the first match of a compiled XPath, or None."""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
 
 async def parse_diary_page(
     client: httpx.AsyncClient,
     diary_url: str,
     page: int = 1,
+    skip_ids: Container[str] | None = None,
 ) -> tuple[list[Film], bool]:
     """Parse a single page of the Letterboxd diary.
 
@@ -23,27 +74,36 @@ async def parse_diary_page(
         client: Async HTTP client
         diary_url: Base diary URL
         page: Page number to fetch
+        skip_ids: Letterboxd IDs to leave out (e.g. entries already in Notion)
 
     Returns:
         Tuple of (films, has_more_pages)
     """
     url = f"{diary_url}/page/{page}/"
-    response = await client.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"})
+    response = await client.get(url, headers=LETTERBOXD_HEADERS)
 
     if response.status_code == 429:
-        raise RateLimitError()
+        retry_after = response.headers.get("Retry-After", "")
+        raise RateLimitError(retry_after=int(retry_after) if retry_after.isdigit() else None)
+    # Speculative fetches can overshoot the last page
+    if response.status_code == 404:
+        return [], False
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    try:
+        doc = html.fromstring(response.content)
+    except etree.ParserError as e:
+        raise ParseError(f"Failed to parse diary page {page}: {e}") from e
+
     films: list[Film] = []
 
     # Buscamos filas de diario (tr) O elementos de la lista de watchlist (li)
-    items = soup.select("tr.diary-entry-row, li.poster-container")
+    items = _ITEMS_XP(doc)
 
     for item in items:
         # Si es una fila, procesa como diario
-        if item.name == "tr":
-            film = _parse_diary_row(item)
+        if item.tag == "tr":
+            film = _parse_diary_row(item, skip_ids)
         # Si es un elemento de lista, procesa como watchlist
         else:
             film = _parse_watchlist_item(item)
@@ -51,37 +111,45 @@ async def parse_diary_page(
         if film:
             films.append(film)
 
-    # Check if there are more pages (empty page means no more)
-    has_more = len(films) > 0
+    # The last page has no "next" link
+    has_more = bool(_NEXT_PAGE_XP(doc))
 
     return films, has_more
     
-def _parse_watchlist_item(item: Tag) -> Film | None:
+def _parse_watchlist_item(item: html.HtmlElement) -> Film | None:
     """Extrae datos de una película de la Watchlist."""
-    poster_div = item.select_one("div.film-poster")
-    if not poster_div:
+    poster_div = _first(_WATCHLIST_POSTER_XP, item)
+    if poster_div is None:
         return None
 
     # En la watchlist el título y el slug están en estos atributos
-    title = poster_div.get("data-item-name") or (item.select_one("img").get("alt") if item.select_one("img") else "Unknown")
+    img = _first(_IMG_XP, item)
+    title = (
+        poster_div.get("data-item-name")
+        or (img.get("alt") if img is not None else None)
+        or "Unknown"
+    )
     slug = poster_div.get("data-film-slug")
     
     if not slug:
         return None
 
-    return Film(
+    return Film.model_construct(
         letterboxd_id=f"watchlist-{slug}",
         tmdb_id=None,
         title=title,
         year=0,
-        letterboxd_url=f"https://letterboxd.com/film/{slug}/",
+        letterboxd_url=_FILM_URL_PREFIX + slug + "/",
         rating=None,
         watched_date=None,
         rewatch=False,
         review=None,
     )
 
-def _parse_diary_row(row: Tag) -> Film | None:
+def _parse_diary_row(
+    row: html.HtmlElement,
+    skip_ids: Container[str] | None = None,
+) -> Film | None:
     """Parse a single diary table row."""
 
     # Get viewing ID for unique identifier
@@ -89,9 +157,15 @@ def _parse_diary_row(row: Tag) -> Film | None:
     if not viewing_id:
         return None
 
+    # Generate letterboxd ID from viewing ID, bailing out before the
+    # remaining extraction work if this entry is already synced
+    letterboxd_id = f"letterboxd-viewing-{viewing_id}"
+    if skip_ids is not None and letterboxd_id in skip_ids:
+        return None
+
     # Find the react-component div with film data
-    poster_div = row.select_one("div.react-component[data-item-slug]")
-    if not poster_div:
+    poster_div = _first(_DIARY_POSTER_XP, row)
+    if poster_div is None:
         return None
 
     # Extract data from data attributes
@@ -102,13 +176,13 @@ def _parse_diary_row(row: Tag) -> Film | None:
         return None
 
     # Extract year from title like "Home Alone (1990)"
-    year_match = re.search(r"\((\d{4})\)$", str(title))
+    year_match = _YEAR_RE.search(str(title))
     year = int(year_match.group(1)) if year_match else 0
 
     # Clean title (remove year)
-    clean_title = re.sub(r"\s*\(\d{4}\)$", "", str(title))
+    clean_title = _YEAR_STRIP_RE.sub("", str(title))
 
-    letterboxd_url = f"https://letterboxd.com/film/{slug}/"
+    letterboxd_url = _FILM_URL_PREFIX + slug + "/"
 
     # Get rating from span.rating
     rating = _extract_rating(row)
@@ -117,18 +191,10 @@ def _parse_diary_row(row: Tag) -> Film | None:
     watched_date = _extract_watched_date(row)
 
     # Check for rewatch (icon-rewatch without icon-status-off)
-    rewatch_td = row.select_one("td.col-rewatch")
-    rewatch_classes = rewatch_td.get("class") if rewatch_td else None
-    rewatch = (
-        rewatch_classes is not None
-        and isinstance(rewatch_classes, list)
-        and "icon-status-off" not in rewatch_classes
-    )
+    rewatch_td = _first(_REWATCH_XP, row)
+    rewatch = rewatch_td is not None and "icon-status-off" not in rewatch_td.classes
 
-    # Generate letterboxd ID from viewing ID
-    letterboxd_id = f"letterboxd-viewing-{viewing_id}"
-
-    return Film(
+    return Film.model_construct(
         letterboxd_id=letterboxd_id,
         tmdb_id=None,  # Not available in HTML, needs TMDB search
         title=clean_title,
@@ -141,39 +207,31 @@ def _parse_diary_row(row: Tag) -> Film | None:
     )
 
 
-def _extract_rating(row: Tag) -> float | None:
+def _extract_rating(row: html.HtmlElement) -> float | None:
     """Extract rating from the row."""
     # Find the rating span with class like "rated-5" or "rated-10"
-    rating_span = row.select_one("span.rating[class*='rated-']")
-    if rating_span:
-        classes = rating_span.get("class")
-        if not isinstance(classes, list):
-            return None
-        for cls in classes:
-            if isinstance(cls, str) and cls.startswith("rated-"):
-                try:
-                    # rated-5 means 2.5 stars (5 half-stars), rated-10 means 5 stars
-                    half_stars = int(cls.replace("rated-", ""))
-                    return half_stars / 2.0
-                except ValueError:
-                    pass
+    rating_span = _first(_RATING_XP, row)
+    if rating_span is None:
+        return None
 
-    return None
+    match = _RATED_RE.search(rating_span.get("class", ""))
+    # rated-5 means 2.5 stars (5 half-stars), rated-10 means 5 stars
+    return int(match.group(1)) / 2.0 if match else None
 
 
-def _extract_watched_date(row: Tag) -> date | None:
+def _extract_watched_date(row: html.HtmlElement) -> date | None:
     """Extract the watch date from the diary row."""
     # Get from the daydate link href like /michaelfromyeg/diary/films/for/2025/12/26/
-    day_link = row.select_one("a.daydate")
-    if not day_link:
+    day_link = _first(_DAYDATE_XP, row)
+    if day_link is None:
         return None
 
-    href = day_link.get("href", "")
-    if not isinstance(href, str):
+    href = day_link.get("href")
+    if not href:
         return None
 
     # Extract date from href
-    match = re.search(r"/for/(\d{4})/(\d{1,2})/(\d{1,2})", href)
+    match = _DATE_RE.search(href)
     if match:
         try:
             return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
@@ -183,40 +241,142 @@ def _extract_watched_date(row: Tag) -> date | None:
     return None
 
 
+def film_slug(letterboxd_url: str) -> str | None:
+    """Extract the film slug from a Letterboxd film, diary or review URL."""
+    match = _SLUG_RE.search(letterboxd_url)
+    return match.group(1) if match else None
+
+
+async def fetch_film_tmdb_id(
+    client: httpx.AsyncClient,
+    slug: str,
+    semaphore: asyncio.Semaphore | None = None,
+) -> int | None:
+    """Read a film's TMDB ID from its Letterboxd film page.
+
+    Args:
+        client: Async HTTP client
+        slug: Letterboxd film slug
+        semaphore: Optional semaphore held while each request is in flight
+
+    Returns:
+        TMDB movie ID, or None if the page has none (or links a TV show)
+
+    Raises:
+        RateLimitError: If still rate limited by Letterboxd after MAX_RETRIES attempts
+    """
+    return await _with_backoff(lambda: _fetch_film_tmdb_id(client, slug), semaphore)
+
+
+async def _fetch_film_tmdb_id(client: httpx.AsyncClient, slug: str) -> int | None:
+    """Fetch a film page once and read its TMDB ID."""
+    url = _FILM_URL_PREFIX + slug + "/"
+    response = await client.get(url, headers=LETTERBOXD_HEADERS)
+
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        raise RateLimitError(retry_after=int(retry_after) if retry_after.isdigit() else None)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+
+    # The attributes sit on <body>, so a regex avoids parsing the whole page
+    type_match = _TMDB_TYPE_RE.search(response.content)
+    if type_match and type_match.group(1) != b"movie":
+        return None
+    id_match = _TMDB_ID_RE.search(response.content)
+    return int(id_match.group(1)) if id_match else None
+
+
+async def _fetch_diary_page(
+    client: httpx.AsyncClient,
+    diary_url: str,
+    page: int,
+    semaphore: asyncio.Semaphore,
+    skip_ids: Container[str] | None = None,
+) -> tuple[list[Film], bool]:
+    """Fetch a diary page, backing off exponentially while rate limited."""
+    return await _with_backoff(
+        lambda: parse_diary_page(client, diary_url, page, skip_ids), semaphore
+    )
+
+
+async def _with_backoff[T](
+    call: Callable[[], Awaitable[T]],
+    semaphore: asyncio.Semaphore | None = None,
+) -> T:
+    """Run a Letterboxd request, retrying with exponential backoff while rate limited.
+
+    The semaphore, if given, is only held while the request is in flight.
+    """
+    delay = 1.0
+    attempt = 1
+    while True:
+        async with semaphore or nullcontext():
+            try:
+                return await call()
+            except RateLimitError as e:
+                if attempt >= MAX_RETRIES:
+                    raise
+                wait = min(e.retry_after or delay, MAX_RETRY_WAIT)
+        # Sleep outside the semaphore so other pages can proceed
+        await asyncio.sleep(wait)
+        attempt += 1
+        delay *= 2
+
+
 async def parse_all_diary_pages(
     client: httpx.AsyncClient,
     diary_url: str,
     on_page: Callable[[int], None] | None = None,
+    skip_ids: Container[str] | None = None,
 ) -> list[Film]:
     """Parse all diary pages for full sync.
 
+    Page 1 is fetched first; later pages are fetched speculatively in
+    batches that double in size (up to MAX_CONCURRENT_PAGES) until the last
+    page (one without a "next" link) is reached.
+
     Args:
         client: Async HTTP client
         diary_url: Base diary URL
-        on_page: Optional callback called with page number
+        on_page: Optional callback called with each page number kept, in order
+        skip_ids: Letterboxd IDs to leave out (e.g. entries already in Notion)
 
     Returns:
-        List of all films from all pages
+        List of all films from all pages, in diary order
     """
-    all_films: list[Film] = []
-    page = 1
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
 
-    while True:
-        if on_page:
-            on_page(page)
-
-        films, has_more = await parse_diary_page(client, diary_url, page)
-
-        if not films:
-            break
+    all_films, has_more = await _fetch_diary_page(client, diary_url, 1, semaphore, skip_ids)
+    if on_page:
+        on_page(1)
+    next_page = 2
+    batch_size = 2
 
-        all_films.extend(films)
-        page += 1
-
-        if not has_more:
-            break
-
-        # Respect rate limits
-        await asyncio.sleep(2)
+    while has_more:
+        pages = range(next_page, next_page + batch_size)
+        try:
+            # A TaskGroup cancels the rest of the batch if one page fails
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_fetch_diary_page(client, diary_url, page, semaphore, skip_ids))
+                    for page in pages
+                ]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from eg
+
+        # Keep results up to the last page; anything after it is overshoot
+        for page, task in zip(pages, tasks, strict=True):
+            films, has_more = task.result()
+            if on_page:
+                on_page(page)
+            all_films.extend(films)
+            if not has_more:
+                break
+
+        next_page += batch_size
+        # At most MAX_CONCURRENT_PAGES - 1 requests are wasted past the last page
+        batch_size = min(batch_size * 2, MAX_CONCURRENT_PAGES)
 
     return all_films
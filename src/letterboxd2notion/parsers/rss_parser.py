@@ -1,20 +1,32 @@
 """RSS feed parser for Letterboxd."""
 
+import re
+from collections.abc import AsyncIterator, Iterator
 from datetime import date
-from xml.etree import ElementTree as ET
+from html import unescape
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
+from letterboxd2notion.config import LETTERBOXD_HEADERS
 from letterboxd2notion.exceptions import ParseError, RateLimitError
 from letterboxd2notion.models import Film
 
-# RSS namespace mappings
-NAMESPACES = {
-    "letterboxd": "https://letterboxd.com",
-    "tmdb": "https://themoviedb.org",
-    "dc": "http://purl.org/dc/elements/1.1/",
-}
+# RSS namespaces in Clark notation ({namespace}local) so lookups skip prefix resolution
+_LETTERBOXD_NS = "{https://letterboxd.com}"
+_TMDB_NS = "{https://themoviedb.org}"
+
+_FILM_TITLE = _LETTERBOXD_NS + "filmTitle"
+_FILM_YEAR = _LETTERBOXD_NS + "filmYear"
+_MEMBER_RATING = _LETTERBOXD_NS + "memberRating"
+_WATCHED_DATE = _LETTERBOXD_NS + "watchedDate"
+_REWATCH = _LETTERBOXD_NS + "rewatch"
+_TMDB_MOVIE_ID = _TMDB_NS + "movieId"
+
+# Review descriptions are flat <p> blocks, so paragraphs are pulled out by regex
+_P_RE = re.compile(r"<p(?:\s[^>]*)?>(.*?)</p>", re.DOTALL)
+_P_OPEN_RE = re.compile(r"<p[\s>]")
+_TAG_RE = re.compile(r"<[^>]+>")
 
 
 async def parse_rss_feed(
@@ -34,28 +46,62 @@ async def parse_rss_feed(
         ParseError: If RSS cannot be parsed
         RateLimitError: If rate limited by Letterboxd
     """
-    response = await client.get(rss_url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"})
+    return [film async for film in iter_rss_items(client, rss_url)]
 
-    if response.status_code == 429:
-        raise RateLimitError(retry_after=int(response.headers.get("Retry-After", 60)))
-    response.raise_for_status()
 
-    try:
-        root = ET.fromstring(response.content)
-    except ET.ParseError as e:
-        raise ParseError(f"Failed to parse RSS XML: {e}") from e
+async def iter_rss_items(
+    client: httpx.AsyncClient,
+    rss_url: str,
+) -> AsyncIterator[Film]:
+    """Yield Film objects from a Letterboxd RSS feed one item at a time.
+
+    The response body is streamed into an incremental parser and each item
+    is released as soon as it has been parsed, so neither the raw feed nor
+    its full tree is held in memory.
 
-    films: list[Film] = []
+    Args:
+        client: Async HTTP client
+        rss_url: URL to Letterboxd RSS feed
 
-    for item in root.findall(".//item"):
+    Yields:
+        Film objects in feed order
+
+    Raises:
+        ParseError: If RSS cannot be parsed
+        RateLimitError: If rate limited by Letterboxd
+    """
+    async with client.stream("GET", rss_url, headers=LETTERBOXD_HEADERS) as response:
+        if response.status_code == 429:
+            raise RateLimitError(retry_after=int(response.headers.get("Retry-After", 60)))
+        response.raise_for_status()
+
+        parser = etree.XMLPullParser(events=("end",), tag="item")
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for film in _read_items(parser):
+                    yield film
+            parser.close()
+            for film in _read_items(parser):
+                yield film
+        except etree.XMLSyntaxError as e:
+            raise ParseError(f"Failed to parse RSS XML: {e}") from e
+
+
+def _read_items(parser: etree.XMLPullParser) -> Iterator[Film]:
+    """Parse the items completed so far, releasing each one afterwards."""
+    for _, item in parser.read_events():
         film = _parse_rss_item(item)
+        # Free the item and every earlier sibling so the tree stays one item deep
+        item.clear()
+        parent = item.getparent()
+        while item.getprevious() is not None and parent is not None:
+            del parent[0]
         if film:
-            films.append(film)
-
-    return films
+            yield film
 
 
-def _parse_rss_item(item: ET.Element) -> Film | None:
+def _parse_rss_item(item: etree._Element) -> Film | None:
     """Parse a single RSS item into a Film object."""
 
     # Extract guid (letterboxd-review-XXXXXXXXX)
@@ -65,13 +111,13 @@ def _parse_rss_item(item: ET.Element) -> Film | None:
     letterboxd_id = guid_elem.text
 
     # Extract film title
-    title_elem = item.find("letterboxd:filmTitle", NAMESPACES)
+    title_elem = item.find(_FILM_TITLE)
     if title_elem is None or title_elem.text is None:
         return None
     title = title_elem.text
 
     # Extract film year
-    year_elem = item.find("letterboxd:filmYear", NAMESPACES)
+    year_elem = item.find(_FILM_YEAR)
     if year_elem is None or year_elem.text is None:
         return None
     year = int(year_elem.text)
@@ -81,27 +127,27 @@ def _parse_rss_item(item: ET.Element) -> Film | None:
     letterboxd_url = link_elem.text if link_elem is not None and link_elem.text else ""
 
     # Extract rating (optional)
-    rating_elem = item.find("letterboxd:memberRating", NAMESPACES)
+    rating_elem = item.find(_MEMBER_RATING)
     rating = float(rating_elem.text) if rating_elem is not None and rating_elem.text else None
 
     # Extract watched date (optional)
-    watched_elem = item.find("letterboxd:watchedDate", NAMESPACES)
+    watched_elem = item.find(_WATCHED_DATE)
     watched_date = None
     if watched_elem is not None and watched_elem.text:
         watched_date = date.fromisoformat(watched_elem.text)
 
     # Extract rewatch flag
-    rewatch_elem = item.find("letterboxd:rewatch", NAMESPACES)
+    rewatch_elem = item.find(_REWATCH)
     rewatch = rewatch_elem is not None and rewatch_elem.text == "Yes"
 
     # Extract TMDB ID
-    tmdb_elem = item.find("tmdb:movieId", NAMESPACES)
+    tmdb_elem = item.find(_TMDB_MOVIE_ID)
     tmdb_id = int(tmdb_elem.text) if tmdb_elem is not None and tmdb_elem.text else None
 
     # Extract review text from description
     review = _extract_review_from_description(item)
 
-    return Film(
+    return Film.model_construct(
         letterboxd_id=letterboxd_id,
         tmdb_id=tmdb_id,
         title=title,
@@ -114,7 +160,7 @@ def _parse_rss_item(item: ET.Element) -> Film | None:
     )
 
 
-def _extract_review_from_description(item: ET.Element) -> str | None:
+def _extract_review_from_description(item: etree._Element) -> str | None:
     """Extract review text from RSS description field.
 
     The description contains HTML like:
@@ -126,21 +172,24 @@ def _extract_review_from_description(item: ET.Element) -> str | None:
     if desc_elem is None or desc_elem.text is None:
         return None
 
-    soup = BeautifulSoup(desc_elem.text, "lxml")
-
-    # Find all paragraphs
-    paragraphs = soup.find_all("p")
+    description = desc_elem.text
+    bodies = _P_RE.findall(description)
+    # Unclosed or nested paragraphs trip the regex; let lxml sort those out
+    if len(bodies) != len(_P_OPEN_RE.findall(description)):
+        fragment = html.fragment_fromstring(description, create_parent="div")
+        paragraphs = [p.text_content() for p in fragment.iter("p")]
+    else:
+        paragraphs = [unescape(_TAG_RE.sub("", body)) for body in bodies]
 
     review_parts: list[str] = []
-    for p in paragraphs:
+    for paragraph in paragraphs:
+        text = paragraph.strip()
         # Skip paragraphs that only contain an image
-        if p.find("img") and not p.get_text(strip=True):
+        if not text:
             continue
         # Skip spoiler warning
-        text = p.get_text(strip=True)
         if text.startswith("This review may contain spoilers"):
             continue
-        if text:
-            review_parts.append(text)
+        review_parts.append(text)
 
     return "\n\n".join(review_parts) if review_parts else None